@@ -1,11 +1,12 @@
-import matplotlib.pyplot as plt
+import functools
+import hashlib
+import inspect
+import os
 import numpy as np
-from matplotlib.ticker import FuncFormatter
+from numba import njit, prange
+from dataclasses import dataclass
 from datetime import datetime
-from scipy.optimize import minimize
-from scipy.stats import norm
-from sklearn.gaussian_process import GaussianProcessRegressor
-from sklearn.gaussian_process.kernels import RBF, ConstantKernel as C
+from scipy.optimize import differential_evolution
 
 # Constants matching Move implementation
 OCTA = 100_000_000  # 10^8 for APT price scaling
@@ -13,6 +14,28 @@ INPUT_SCALE = 1_000_000  # 10^6 for overflow prevention
 INITIAL_PRICE = 100_000_000  # 1 APT in OCTA units
 BPS = 10000  # 100% = 10000 basis points
 
+# Default weights matching Move implementation
+DEFAULT_WEIGHT_A = 173  # 1.73% in basis points
+DEFAULT_WEIGHT_B = 257  # 2.57% in basis points
+DEFAULT_WEIGHT_C = 23  # Constant offset
+
+@dataclass(frozen=True, slots=True)
+class Weights:
+    """
+    One weight configuration, passed explicitly to the pricing functions
+    Hashable, so it doubles as the key of the per configuration caches
+    """
+    a: int  # Basis points
+    b: int  # Basis points
+    c: int  # Constant offset
+
+DEFAULT_WEIGHTS = Weights(DEFAULT_WEIGHT_A, DEFAULT_WEIGHT_B, DEFAULT_WEIGHT_C)
+
+SUMMATION_CACHE_SIZE = 1 << 14  # Covers n = s + c - 1 for every plotted supply
+PRICE_CACHE_DIR = ".cache"  # On-disk cache of plotted price sweeps
+PRICE_TABLE_MIN_SIZE = 1 << 10  # Smallest shared price table, covering every supply the reports read
+RESULTS_FILENAME = "BondingCurveTestingResults.txt"  # Log appended to by every saved analysis
+
 # Target prices at key supply points with detailed rationale
 TARGET_PRICES = {
     1: 1.0,      # Supply 1: 1 APT – Ultra-accessible founder entry
@@ -33,8 +56,79 @@ PHASES = {
     'exclusive': (51, 100) # Exclusivity phase
 }
 
+# Supplies priced on every objective evaluation, covering each target point
+# and the smoothness window
+OBJECTIVE_SUPPLIES = np.arange(max(max(TARGET_PRICES), 100) + 1, dtype=np.int32)
+
+# Target error weight of each phase, higher for early phase accuracy
+PHASE_ERROR_WEIGHTS = {
+    'early': 2.0,
+    'growth': 1.5,
+    'premium': 1.2,
+    'exclusive': 1.0
+}
+
+# Target points as arrays, each with the error weight of its phase, and the
+# highest weight for the supply=100 target
+TARGET_SUPPLIES = np.array(list(TARGET_PRICES))
+TARGET_PRICE_VALUES = np.array(list(TARGET_PRICES.values()), dtype=np.float64)
+TARGET_ERROR_WEIGHTS = np.select(
+    [TARGET_SUPPLIES == 100] + [
+        (TARGET_SUPPLIES >= start) & (TARGET_SUPPLIES <= end) for start, end in PHASES.values()
+    ],
+    [3.0] + [PHASE_ERROR_WEIGHTS[phase] for phase in PHASES],
+    default=1.0
+)
+
+# Early phase price caps for supplies 1..15, 8 APT where no target is set
+EARLY_PRICE_CAPS = np.array([TARGET_PRICES.get(supply, 8.0) for supply in range(1, 16)])
+
+@functools.lru_cache(maxsize=4096)
+def _score(weights):
+    """
+    Score one integer weight configuration against the target goals
+    Lower score is better
+    """
+    # Price every supply the score looks at in one compiled sweep
+    price_curve = _sweep_prices(OBJECTIVE_SUPPLIES, 1, False, weights.a, weights.b, weights.c) / OCTA
+    prices = price_curve.tolist()  # Python floats score faster than NumPy scalars
+    
+    # Calculate errors for target points with phase-based weighting
+    error_ratios = price_curve[TARGET_SUPPLIES] / TARGET_PRICE_VALUES - 1
+    total_error = (error_ratios * error_ratios) @ TARGET_ERROR_WEIGHTS
+    
+    # Penalties for constraint violations
+    penalties = 0
+    
+    # Strong penalty for early prices being too high, squared excess summed
+    # as a dot product with prices under their cap clipped to zero
+    excess = np.maximum(price_curve[1:16] - EARLY_PRICE_CAPS, 0)
+    penalties += (excess @ excess) * 2.0
+    
+    # Penalty for incorrect price progression (ensure monotonic increase)
+    last_price = 0
+    for supply in sorted(TARGET_PRICES.keys()):
+        price = prices[supply]
+        if price <= last_price and supply > 1:  # Allow first price to be equal
+            penalties += (last_price - price + 0.1) ** 2 * 1.5
+        last_price = price
+    
+    # Strong penalty for price at supply 100 being outside target range
+    price_100 = prices[100]
+    if price_100 < 100 or price_100 > 250:  # Enforce strict range for supply=100
+        penalties += ((price_100 - 200) / 200) ** 2 * 5.0  # Increased penalty weight
+    
+    # Calculate smoothness penalty over consecutive supplies 1..100, where
+    # only increases of more than 100% contribute
+    last_prices = price_curve[1:100]
+    overshoot = np.maximum((price_curve[2:101] - last_prices) / last_prices - 1, 0)
+    smoothness_penalty = overshoot @ overshoot
+    
+    return total_error + penalties + smoothness_penalty * 0.5
+
 class BondingCurveOptimizer:
-    def __init__(self):
+    def __init__(self, results_file=None):
+        self.results_file = results_file
         self.best_score = float('inf')
         self.best_weights = None
         self.history = []
@@ -50,168 +144,85 @@ class BondingCurveOptimizer:
         if not (100 <= weight_a <= 20000 and 100 <= weight_b <= 20000 and 1 <= weight_c <= 100):
             return float('inf')
         
-        # Set weights for calculation
-        global DEFAULT_WEIGHT_A, DEFAULT_WEIGHT_B, DEFAULT_WEIGHT_C
-        DEFAULT_WEIGHT_A = int(weight_a)
-        DEFAULT_WEIGHT_B = int(weight_b)
-        DEFAULT_WEIGHT_C = int(weight_c)
-        
-        # Calculate errors for target points with phase-based weighting
-        total_error = 0
-        phase_errors = {phase: 0 for phase in PHASES.keys()}
-        
-        for supply, target_price in TARGET_PRICES.items():
-            actual_price = calculate_price(supply, 1, False) / OCTA
-            error = abs(actual_price - target_price)
-            error_ratio = abs(actual_price / target_price - 1)
-            
-            # Weight errors by phase
-            if supply <= 15:
-                phase_errors['early'] += error_ratio ** 2 * 2.0  # Higher weight for early phase accuracy
-            elif supply <= 25:
-                phase_errors['growth'] += error_ratio ** 2 * 1.5
-            elif supply <= 50:
-                phase_errors['premium'] += error_ratio ** 2 * 1.2
-            else:
-                # Extra weight for supply=100 target
-                if supply == 100:
-                    phase_errors['exclusive'] += error_ratio ** 2 * 3.0  # Increased weight for supply=100
-                else:
-                    phase_errors['exclusive'] += error_ratio ** 2
-        
-        # Add phase errors to total
-        total_error = sum(phase_errors.values())
-        
-        # Penalties for constraint violations
-        penalties = 0
-        
-        # Strong penalty for early prices being too high
-        for supply in range(1, 16):
-            price = calculate_price(supply, 1, False) / OCTA
-            if price > TARGET_PRICES.get(supply, 8.0):  # Use 8.0 as default cap for early phase
-                penalties += (price - TARGET_PRICES.get(supply, 8.0)) ** 2 * 2.0
-        
-        # Penalty for incorrect price progression (ensure monotonic increase)
-        last_price = 0
-        for supply in sorted(TARGET_PRICES.keys()):
-            price = calculate_price(supply, 1, False) / OCTA
-            if price <= last_price and supply > 1:  # Allow first price to be equal
-                penalties += (last_price - price + 0.1) ** 2 * 1.5
-            last_price = price
-        
-        # Strong penalty for price at supply 100 being outside target range
-        price_100 = calculate_price(100, 1, False) / OCTA
-        if price_100 < 100 or price_100 > 250:  # Enforce strict range for supply=100
-            penalties += ((price_100 - 200) / 200) ** 2 * 5.0  # Increased penalty weight
-        
-        # Calculate smoothness penalty
-        smoothness_penalty = 0
-        for i in range(1, 100):
-            price_i = calculate_price(i, 1, False) / OCTA
-            price_next = calculate_price(i + 1, 1, False) / OCTA
-            if price_next - price_i > price_i:  # More than 100% increase
-                smoothness_penalty += ((price_next - price_i) / price_i - 1) ** 2
-        
-        score = total_error + penalties + smoothness_penalty * 0.5
+        # Only the integer weights reach the price kernels, so candidates that
+        # truncate to the same triple share one cached score
+        score = _score(Weights(int(weight_a), int(weight_b), int(weight_c)))
         
         # Store if best so far
         if score < self.best_score:
             self.best_score = score
             self.best_weights = weights
-            self.save_weight_results(weights, score)
+            self.record_weight_results(weights, score)
         
         return score
     
     def save_weight_results(self, weights, score):
-        """Save the results of a weight configuration"""
+        """
+        Save the results of a weight configuration
+        Returns the captured analysis, without the score header
+        """
         weight_a, weight_b, weight_c = weights
-        
-        # Set weights for analysis
-        global DEFAULT_WEIGHT_A, DEFAULT_WEIGHT_B, DEFAULT_WEIGHT_C
-        DEFAULT_WEIGHT_A = int(weight_a)
-        DEFAULT_WEIGHT_B = int(weight_b)
-        DEFAULT_WEIGHT_C = int(weight_c)
+        weights = Weights(int(weight_a), int(weight_b), int(weight_c))
         
         # Capture analysis
-        results = capture_analysis()
+        results = capture_analysis(weights)
         
         # Add optimization details
         optimization_info = f"\nOptimization Score: {score:.6f}\n"
-        results = optimization_info + results
         
         # Save to file
-        save_results_to_file(results)
-        
-        # Store in history
+        save_results_to_file(optimization_info + results, weights, self.results_file)
+        return results
+    
+    def record_weight_results(self, weights, score):
+        """Record an improved weight configuration in the history"""
         self.history.append({
             'weights': weights,
             'score': score
         })
     
-    def bayesian_optimization(self, n_iterations=500):
+    def differential_evolution_optimization(self, n_iterations=100):
         """
-        Perform Bayesian optimization to find optimal weights
+        Perform differential evolution to find optimal weights
         """
         # Define bounds with expanded ranges
         bounds = [(100, 20000), (100, 20000), (1, 100)]
         
-        # Initialize with more random points
-        n_random = 50
-        X = np.random.uniform(
-            low=[b[0] for b in bounds],
-            high=[b[1] for b in bounds],
-            size=(n_random, 3)
-        )
-        y = np.array([self.objective_function(x) for x in X])
-        
-        # Gaussian Process with adjusted kernel for larger ranges
-        kernel = C(1.0) * RBF([1000.0, 1000.0, 10.0])  # Adjusted length scales for larger ranges
-        gp = GaussianProcessRegressor(kernel=kernel, n_restarts_optimizer=25)
+        iteration = 0
         
-        for i in range(n_iterations):
-            # Fit GP
-            gp.fit(X, y)
-            
-            # Define acquisition function (Expected Improvement)
-            def expected_improvement(x):
-                x = x.reshape(1, -1)
-                mu, sigma = gp.predict(x, return_std=True)
-                
-                # Find best observed value
-                y_best = np.min(y)
-                
-                # Calculate improvement
-                imp = y_best - mu
-                Z = imp / sigma
-                ei = imp * norm.cdf(Z) + sigma * norm.pdf(Z)
-                
-                return -ei
-            
-            # Find next point to evaluate
-            x_next = minimize(
-                expected_improvement,
-                X[np.argmin(y)],
-                bounds=bounds,
-                method='L-BFGS-B'
-            ).x
-            
-            # Evaluate point
-            y_next = self.objective_function(x_next)
-            
-            # Add to observed data
-            X = np.vstack((X, x_next))
-            y = np.append(y, y_next)
-            
-            print(f"\nIteration {i+1}/{n_iterations}")
+        def report_progress(intermediate_result):
+            nonlocal iteration
+            iteration += 1
+            print(f"\nIteration {iteration}/{n_iterations}")
             print(f"Best score so far: {self.best_score:.6f}")
             print(f"Best weights: A={self.best_weights[0]:.0f}, B={self.best_weights[1]:.0f}, C={self.best_weights[2]:.1f}")
         
+        # The price kernels only ever see integer weights, so search the
+        # integer lattice directly. The score is flat between lattice points,
+        # leaving nothing for a gradient polish to refine
+        differential_evolution(
+            self.objective_function,
+            bounds,
+            maxiter=n_iterations,
+            popsize=15,
+            integrality=[True, True, True],
+            polish=False,
+            callback=report_progress
+        )
+        
         return self.best_weights, self.best_score
 
-def optimize_weights():
-    """Run the optimization process"""
-    optimizer = BondingCurveOptimizer()
-    best_weights, best_score = optimizer.bayesian_optimization(n_iterations=500)  # Changed from 50 to 500
+def optimize_weights(results_file=None):
+    """
+    Run the optimization process
+    Returns the best weights and the analysis saved for them
+    """
+    optimizer = BondingCurveOptimizer(results_file)
+    best_weights, best_score = optimizer.differential_evolution_optimization(n_iterations=100)
+    
+    # Analyse and save only the winning configuration, once the search is
+    # over, instead of on every improvement
+    results = optimizer.save_weight_results(best_weights, best_score)
     
     print("\nOptimization Complete!")
     print(f"Best score: {best_score:.6f}")
@@ -220,74 +231,80 @@ def optimize_weights():
     print(f"WEIGHT_B: {best_weights[1]:.0f} ({best_weights[1]/100:.2f}%)")
     print(f"WEIGHT_C: {best_weights[2]:.1f}")
     
-    return best_weights
+    return best_weights, results
+
+def calculate_summation_vec(ns):
+    """
+    Vectorized calculate_summation over an array of n
+    The product n * (n + 1) * (2n + 1) is always divisible by 6, so the closed
+    form is exact without the scalar version's strategic factoring
+    """
+    ns = np.asarray(ns, dtype=np.int64)
+    return ns * (ns + 1) * (2 * ns + 1) // 6
+
+def build_summation_cache(size):
+    """
+    Precompute summation terms for n in [0, size)
+    The summation does not depend on the weights, so one table serves every run
+    """
+    return calculate_summation_vec(np.arange(size))
 
+_SUMMATION_CACHE = build_summation_cache(SUMMATION_CACHE_SIZE)
+
+INT64_MAX = 2**63 - 1  # Largest value the compiled kernels can hold
+
+# Overflow budget: the compiled kernels and vectorized sweeps below run in
+# native int64, not Python's arbitrary precision ints, and wrap silently past
+# 2^63. A single pass price stays in range up to supply ~85,000 with the Move
+# weights (173/257/23), but only up to ~4,000 at the optimizer's upper bounds
+# (20000/20000/100), and multi pass totals shrink that further. Inputs scaled
+# by OCTA, as in print_price_analysis, are far outside it. The public wrappers
+# check their inputs against it: calculate_price and calculate_single_pass_price
+# fall back to exact Python ints past it, as do the price table and the plotted
+# sweeps, while sweep_prices, which returns int64 arrays, raises OverflowError.
+# _score only prices supplies up to 100, which fits at every weight inside the
+# optimizer's bounds.
+#
+# Every // in the kernels divides by a compile-time constant (2, 3, BPS), which
+# LLVM already lowers to multiply-high and shift, so no magic-number division
+# is written out by hand. NumPy does the same for scalar divisors.
+#
+# The explicit signatures make Numba compile each kernel eagerly at import, and
+# cache=True reuses that build on later runs, so no warm-up call is needed
+# before the first timed sweep.
+
+@njit("int64(int64)", cache=True)
 def calculate_summation(n):
     """
     Calculate summation term: (n * (n + 1) * (2n + 1)) / 6
-    Using strategic factoring to prevent overflow while maintaining precision
+    The product is always divisible by 6, so the division is exact. Unlike the
+    Move version's strategic factoring, the full product is formed first, which
+    stays in int64 up to n ~ 1.6M, far beyond the price overflow budget
     """
-    if n == 0:
-        return 0
-    
-    # Calculate components
-    two_n = 2 * n
-    two_n_plus_1 = two_n + 1
-    
-    # Calculate (n + 1) * (2n + 1) = 2n^2 + 3n + 1
-    n_squared = n * n
-    two_n_squared = 2 * n_squared
-    three_n = 3 * n
-    inner_sum = two_n_squared + three_n + 1
-    
-    # Handle divisions strategically to minimize precision loss
-    mut_inner_sum = inner_sum
-    mut_n = n
-    
-    # Try to divide by 2 first if possible
-    if mut_inner_sum % 2 == 0:
-        mut_inner_sum = mut_inner_sum // 2
-    elif mut_n % 2 == 0:
-        mut_n = mut_n // 2
-    
-    # Try to divide by 3 if possible
-    if mut_inner_sum % 3 == 0:
-        mut_inner_sum = mut_inner_sum // 3
-    elif mut_n % 3 == 0:
-        mut_n = mut_n // 3
-    
-    # Multiply remaining terms
-    mut_result = mut_n * mut_inner_sum
-    
-    # Apply any remaining divisions needed
-    if inner_sum % 2 != 0 and n % 2 != 0:
-        mut_result = mut_result // 2
-    if inner_sum % 3 != 0 and n % 3 != 0:
-        mut_result = mut_result // 3
-    
-    return mut_result
+    return n * (n + 1) * (2 * n + 1) // 6
 
-def calculate_single_pass_price(supply):
+@njit("int64(int64)", cache=True)
+def _cached_summation(n):
     """
-    Calculate price for a single pass at a given supply level
+    Look up the summation term, computing it past the cache
+    """
+    if n < SUMMATION_CACHE_SIZE:
+        return _SUMMATION_CACHE[n]
+    return calculate_summation(n)
+
+@njit("int64(int64, int64, int64)", cache=True)
+def _weighted_price(s, weight_a, weight_b):
+    """
+    Apply the weights to a summation term
     Returns the calculated price in OCTA units
     """
-    # Early return for first purchase
-    if supply == 0:
-        return INITIAL_PRICE
-    
-    # Calculate n = s + c - 1
-    s_plus_c = supply + DEFAULT_WEIGHT_C
-    if s_plus_c <= 1:
-        return INITIAL_PRICE
-    n = s_plus_c - 1
-    
-    # Calculate summation at this supply level
-    s = calculate_summation(n)
-    
-    # Apply weights directly without scaling
-    weighted_a = (s * DEFAULT_WEIGHT_A) // BPS
-    weighted_b = (weighted_a * DEFAULT_WEIGHT_B) // BPS
+    # Apply weights directly without scaling. The divide stays staged rather
+    # than fused into (s * A * B) // BPS^2, which rounds differently from the
+    # Move contract at some supplies (106 of the first 10,000 at 173/257/23,
+    # each 1 APT too high). The weights stay runtime arguments rather than
+    # compiled-in constants, since the optimizer changes them on every evaluation
+    weighted_a = (s * weight_a) // BPS
+    weighted_b = (weighted_a * weight_b) // BPS
     
     # Scale to OCTA
     price = weighted_b * OCTA
@@ -295,35 +312,366 @@ def calculate_single_pass_price(supply):
     # Return at least initial price
     return max(INITIAL_PRICE, price)
 
-def calculate_price(supply, amount, is_sell):
+@njit("int64(int64, int64, int64, int64)", cache=True)
+def _single_pass_price(supply, weight_a, weight_b, weight_c):
     """
-    Calculate total price for buying/selling amount of passes at current supply
+    Compiled single pass price kernel, weights passed explicitly
+    Returns the calculated price in OCTA units
+    """
+    # Calculate n = s + c - 1, clamped so s + c <= 1 falls through to the
+    # initial price floor in _weighted_price instead of returning early
+    n = max(supply + weight_c - 1, 0)
+    price = _weighted_price(_cached_summation(n), weight_a, weight_b)
+    
+    # First purchase always costs the initial price
+    return INITIAL_PRICE if supply == 0 else price
+
+@njit("int64(int64, int64, boolean, int64, int64, int64)", cache=True)
+def _price(supply, amount, is_sell, weight_a, weight_b, weight_c):
+    """
+    Compiled total price kernel for buying/selling amount of passes
     Returns the calculated price in OCTA units
     """
+    # Single pass trades (every sweep, table and analysis lookup) price one
+    # supply level directly, skipping the loop setup below
+    if amount == 1:
+        current_supply = max(supply - 1, 0) if is_sell else supply
+        return _single_pass_price(current_supply, weight_a, weight_b, weight_c)
+    
     total_price = 0
     
+    if not is_sell and supply + weight_c >= 1:
+        # Consecutive buys step n by one, so each pass extends the previous
+        # summation with T(n + 1) = T(n) + (n + 1)^2 instead of recomputing it
+        n = supply + weight_c - 1
+        s = _cached_summation(n)
+        
+        for i in range(amount):
+            if supply + i == 0:
+                total_price += INITIAL_PRICE  # First purchase
+            else:
+                total_price += _weighted_price(s, weight_a, weight_b)
+            n += 1
+            s += n * n
+        
+        return total_price
+    
+    if is_sell and weight_c >= 1:
+        # Sells walk down from supply - 1. Passes that would dip below supply 1
+        # clamp to supply 0 and cost the initial price, so they are counted up
+        # front and the rest step the summation down with T(n - 1) = T(n) - n^2
+        priced = min(amount, max(supply - 1, 0))
+        n = supply + weight_c - 2
+        s = _cached_summation(n) if priced > 0 else 0
+        
+        for i in range(priced):
+            total_price += _weighted_price(s, weight_a, weight_b)
+            s -= n * n
+            n -= 1
+        
+        return total_price + (amount - priced) * INITIAL_PRICE
+    
     for i in range(amount):
         # For buys: calculate price at current supply level
         # For sells: calculate price at current supply level - 1
         if is_sell:
-            # Prevent underflow for sells
-            if supply <= i + 1:
-                current_supply = 0  # Return initial price for selling last pass
-            else:
-                current_supply = supply - i - 1  # When selling, look at price at supply-1
+            # Clamp at 0 to prevent underflow, pricing the last pass at the initial price
+            current_supply = max(supply - i - 1, 0)  # When selling, look at price at supply-1
         else:
             current_supply = supply + i  # When buying, look at price at current supply
         
         # Calculate price for this single pass
-        pass_price = calculate_single_pass_price(current_supply)
-        total_price += pass_price
+        total_price += _single_pass_price(current_supply, weight_a, weight_b, weight_c)
     
     return total_price
 
-def plot_bonding_curves():
+@njit(["int64[:](int32[:], int64, boolean, int64, int64, int64)",
+       "int64[:](int64[:], int64, boolean, int64, int64, int64)"], parallel=True, cache=True)
+def _sweep_prices(supplies, amount, is_sell, weight_a, weight_b, weight_c):
+    """
+    Compiled buy/sell price sweep of amount passes over an array of supplies
+    Supplies are priced independently, so the loop is spread across cores.
+    int32 supplies are widened to int64 per element before any arithmetic
+    """
+    out = np.empty(supplies.shape[0], np.int64)
+    for i in prange(supplies.shape[0]):
+        out[i] = _price(supplies[i], amount, is_sell, weight_a, weight_b, weight_c)
+    return out
+
+# Hash of the pricing kernels' source, the summation table they read and the
+# curve constants Numba compiles into them, so anything derived from their
+# output (the on-disk sweep cache) is invalidated whenever the pricing changes
+_price_kernel_hash = hashlib.blake2b(digest_size=7)
+_price_kernel_hash.update("".join(inspect.getsource(kernel.py_func) for kernel in (
+    calculate_summation, _cached_summation, _weighted_price,
+    _single_pass_price, _price, _sweep_prices,
+)).encode())
+_price_kernel_hash.update(_SUMMATION_CACHE.tobytes())
+_price_kernel_hash.update(f"{OCTA}_{INITIAL_PRICE}_{BPS}".encode())
+PRICE_KERNEL_HASH = int.from_bytes(_price_kernel_hash.digest(), "big")
+
+def _exact_single_pass_price(supply, weights):
+    """
+    Python int counterpart of _single_pass_price, exact for any supply
+    Returns the calculated price in OCTA units
+    """
+    if supply == 0:
+        return INITIAL_PRICE
+    n = max(supply + weights.c - 1, 0)
+    weighted_a = (calculate_summation.py_func(n) * weights.a) // BPS
+    weighted_b = (weighted_a * weights.b) // BPS
+    return max(INITIAL_PRICE, weighted_b * OCTA)
+
+def _fits_int64(top_supply, amount, weights):
+    """
+    Check that amount passes priced at or below top_supply stay in int64
+    Prices grow with supply, so the intermediates of the top pass and amount
+    times its price bound every pass and the running total
+    """
+    n = max(top_supply + weights.c - 1, 0)
+    product = n * (n + 1) * (2 * n + 1)
+    scaled_a = product // 6 * weights.a
+    scaled_b = scaled_a // BPS * weights.b
+    price = max(INITIAL_PRICE, scaled_b // BPS * OCTA)
+    return max(product, scaled_a, scaled_b, price * max(amount, 1)) <= INT64_MAX
+
+@functools.lru_cache(maxsize=8)
+def _max_safe_supply(weights):
+    """
+    Largest supply whose single pass price stays in int64
+    Single pass intermediates never decrease with supply, so every supply up to
+    the result fits, leaving a single comparison per checked call
+    """
+    # Double past the boundary, then bisect back to it
+    lo, hi = 0, 1
+    while _fits_int64(hi, 1, weights):
+        lo, hi = hi, hi * 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _fits_int64(mid, 1, weights):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+def _check_sweep_range(max_supply, is_sell, weights):
+    """
+    Raise OverflowError when a single pass sweep up to max_supply leaves int64
+    """
+    top_supply = max(max_supply - 1, 0) if is_sell else max_supply
+    if top_supply > _max_safe_supply(weights):
+        raise OverflowError(
+            f"supply {max_supply} overflows the int64 price kernels for {weights}"
+        )
+
+def calculate_single_pass_price(supply, weights=DEFAULT_WEIGHTS):
+    """
+    Calculate price for a single pass at a given supply level
+    Returns the calculated price in OCTA units, exact past the overflow budget
+    """
+    # NumPy integers would wrap in the exact fallback too, so work in Python ints
+    supply = int(supply)
+    if supply > _max_safe_supply(weights):
+        return _exact_single_pass_price(supply, weights)
+    return _single_pass_price(supply, weights.a, weights.b, weights.c)
+
+def calculate_price(supply, amount, is_sell, weights=DEFAULT_WEIGHTS):
+    """
+    Calculate total price for buying/selling amount of passes at current supply
+    Returns the calculated price in OCTA units, exact past the overflow budget
+    """
+    # NumPy integers would wrap in the exact fallback too, so work in Python ints
+    supply, amount = int(supply), int(amount)
+    top_supply = max(supply - 1, 0) if is_sell else supply + max(amount - 1, 0)
+    
+    # Multi pass totals also need amount times the top price to fit
+    if top_supply > _max_safe_supply(weights) or (
+        amount > 1 and amount * _exact_single_pass_price(top_supply, weights) > INT64_MAX
+    ):
+        # Same pass by pass walk as _price, in Python ints
+        return sum(
+            _exact_single_pass_price(max(supply - i - 1, 0) if is_sell else supply + i, weights)
+            for i in range(amount)
+        )
+    return _price(supply, amount, is_sell, weights.a, weights.b, weights.c)
+
+def _supply_array(supplies):
+    """
+    Supplies as an int32 or int64 array for _sweep_prices
+    int32 input is kept as is, halving the memory the sweep reads
+    """
+    supplies = np.asarray(supplies)
+    if supplies.dtype == np.int32:
+        return supplies
+    return supplies.astype(np.int64, copy=False)
+
+def calculate_prices_vec(supplies, amount, is_sell, weights=DEFAULT_WEIGHTS):
+    """
+    Vectorized calculate_price over an array of starting supplies
+    Returns an int64 array of total prices in OCTA units when every total fits
+    the overflow budget, and an object array of exact Python ints otherwise
+    """
+    supplies = _supply_array(supplies)
+    amount = int(amount)
+    max_supply = int(supplies.max()) if supplies.size else 0
+    top_supply = max(max_supply - 1, 0) if is_sell else max_supply + max(amount - 1, 0)
+    if top_supply <= _max_safe_supply(weights) and (
+        amount <= 1 or amount * _exact_single_pass_price(top_supply, weights) <= INT64_MAX
+    ):
+        return _sweep_prices(supplies, amount, is_sell, weights.a, weights.b, weights.c)
+    return np.array([
+        calculate_price(supply, amount, is_sell, weights) for supply in supplies.tolist()
+    ], dtype=object)
+
+def cached_sweep_prices(supplies, is_sell, weights=DEFAULT_WEIGHTS):
+    """
+    Exact single pass sweep backed by an on-disk cache in PRICE_CACHE_DIR
+    Sweeps are deterministic in the pricing code, curve constants and weights,
+    so the cache key covers those (the first two through PRICE_KERNEL_HASH)
+    together with the supplies themselves.
+    Sweeps past the overflow budget come back as Python ints, which np.save
+    could only pickle, so those are recomputed instead of cached
+    """
+    supplies = _supply_array(supplies)
+    key = hashlib.blake2b(digest_size=8)
+    key.update(f"{PRICE_KERNEL_HASH}_{weights.a}_{weights.b}_{weights.c}_{is_sell}_{supplies.dtype}".encode())
+    key.update(supplies.tobytes())
+    path = os.path.join(PRICE_CACHE_DIR, f"prices_{key.hexdigest()}.npy")
+    
+    if os.path.exists(path):
+        return np.load(path)
+    
+    prices = calculate_prices_vec(supplies, 1, is_sell, weights)
+    if prices.dtype == object:
+        return prices
+    
+    os.makedirs(PRICE_CACHE_DIR, exist_ok=True)
+    
+    # Write to a temporary file first and swap it in, so an interrupted save
+    # never leaves a truncated .npy behind for the next run to load
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, prices)
+    os.replace(tmp_path, path)
+    return prices
+
+def sweep_prices(supplies, is_sell, weights=DEFAULT_WEIGHTS):
+    """
+    Calculate the price of one pass at every supply in supplies
+    Returns an int64 array of prices in OCTA units, see the overflow budget
+    Raises OverflowError when the largest supply leaves int64
+    """
+    supplies = _supply_array(supplies)
+    if supplies.size:
+        _check_sweep_range(int(supplies.max()), is_sell, weights)
+    return _sweep_prices(supplies, 1, is_sell, weights.a, weights.b, weights.c)
+
+@functools.lru_cache(maxsize=4)
+def _build_price_table(weights, is_sell, size):
+    """
+    Build the read-only price table for one weight configuration and side
+    """
+    table = calculate_prices_vec(np.arange(size, dtype=np.int32), 1, is_sell, weights)
+    table.flags.writeable = False
+    return table
+
+def get_price_table(max_supply, is_sell=False, weights=DEFAULT_WEIGHTS):
+    """
+    Single pass buy or sell prices for supplies 0..max_supply (at least) under weights
+    Sizes are rounded up to a power of two, no smaller than PRICE_TABLE_MIN_SIZE,
+    so every analysis indexes the same table instead of re-pricing the supplies
+    it shares with the others. Past the overflow budget the table holds exact
+    Python ints instead of int64
+    """
+    size = max(PRICE_TABLE_MIN_SIZE, 1 << int(max_supply).bit_length())
+    return _build_price_table(weights, is_sell, size)
+
+def calculate_summation_prefix(m):
+    """
+    Sum of summation terms T(0) + T(1) + ... + T(m) = m(m + 1)^2(m + 2) / 12
+    Exact in Python ints, the numerator is always divisible by 12
+    """
+    if m < 0:
+        return 0
+    return m * (m + 1) ** 2 * (m + 2) // 12
+
+def sum_summation_range(a, b):
+    """
+    Exact sum of summation terms T(a) + ... + T(b) via prefix differences
+    """
+    if b < a:
+        return 0
+    return calculate_summation_prefix(b) - calculate_summation_prefix(a - 1)
+
+@functools.lru_cache(maxsize=8)
+def _last_floor_supply(weights):
+    """
+    Largest supply whose single pass price sits on the initial price floor
+    Single pass prices never decrease with supply, so the floor covers
+    supplies 1..result (none when the result is 0)
+    """
+    def on_floor(supply):
+        # Same staged arithmetic as _weighted_price, in Python ints
+        n = max(supply + weights.c - 1, 0)
+        s = n * (n + 1) * (2 * n + 1) // 6
+        return ((s * weights.a) // BPS * weights.b) // BPS * OCTA <= INITIAL_PRICE
+    
+    # Double past the boundary, then bisect back to it
+    lo, hi = 0, 1
+    while on_floor(hi):
+        lo, hi = hi, hi * 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if on_floor(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+def calculate_price_closed_form(supply, amount, is_sell, weights=DEFAULT_WEIGHTS):
+    """
+    O(1) counterpart of calculate_price for amounts too large to loop over
+    Returns the calculated price in OCTA units
+    
+    Passes on the initial price floor are counted exactly. Past the floor the
+    weights are applied once to the summed summation terms rather than per
+    pass, so the result can differ from calculate_price by the per pass
+    truncation. Use calculate_price wherever Move parity matters.
+    """
+    # Passes priced on the curve cover supplies first..last; any others are
+    # the first purchase or sells clamped at 0, which cost the initial price
+    if is_sell:
+        first, last = max(supply - amount, 1), supply - 1
+    else:
+        first, last = max(supply, 1), supply + amount - 1
+    curve_passes = max(last - first + 1, 0)
+    initial_passes = amount - curve_passes
+    
+    # Split the curve passes at the floor boundary: those up to it cost the
+    # initial price each, the rest are summed in closed form
+    boundary = _last_floor_supply(weights)
+    floor_passes = max(min(last, boundary) - first + 1, 0)
+    first = max(first, boundary + 1)
+    
+    # Sum summation terms over n = s + c - 1 for the passes past the floor
+    s = sum_summation_range(first + weights.c - 1, last + weights.c - 1)
+    
+    # Apply weights to the sum
+    weighted_a = (s * weights.a) // BPS
+    weighted_b = (weighted_a * weights.b) // BPS
+    
+    return (initial_passes + floor_passes) * INITIAL_PRICE + weighted_b * OCTA
+
+def plot_bonding_curves(weights=DEFAULT_WEIGHTS):
     """
     Create 4 plots showing different supply ranges
     """
+    # Imported here so library use of the pricing functions skips matplotlib.
+    # The figure is drawn straight onto an Agg canvas, bypassing pyplot's
+    # global figure registry
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
     ranges = [
         (0, 25, "First 25 Supply Points"),
         (0, 100, "First 100 Supply Points"),
@@ -331,53 +679,70 @@ def plot_bonding_curves():
         (0, 10000, "Supply Points up to 10,000")
     ]
     
+    # One figure and its axes are cleared and redrawn for every range instead
+    # of building and tearing down a canvas per plot. The ranges stay in this
+    # process: all four render in about a second, less than a spawned worker
+    # takes to re-import this module, and forked workers hang the parent at
+    # exit once Numba's TBB threading layer is loaded. The tight layout runs
+    # on every draw, so savefig can skip the extra bbox_inches='tight' pass
+    fig = Figure(figsize=(12, 8), layout='tight')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    
+    # Price the widest range once and slice the smaller plots out of it
+    # Supplies fit in int32; prices are still computed and returned in int64
+    all_supplies = np.arange(0, max(end for _, end, _ in ranges) + 1, dtype=np.int32)
+    all_buy_prices = cached_sweep_prices(all_supplies, False, weights) / OCTA
+    all_sell_prices = cached_sweep_prices(all_supplies, True, weights) / OCTA
+    
     for start, end, title in ranges:
-        supplies = np.arange(start, end + 1)
-        buy_prices = [calculate_price(s, 1, False) / OCTA for s in supplies]
-        sell_prices = [calculate_price(s, 1, True) / OCTA for s in supplies]
+        supplies = all_supplies[start:end + 1]
+        buy_prices = all_buy_prices[start:end + 1]
+        sell_prices = all_sell_prices[start:end + 1]
         
-        plt.figure(figsize=(12, 8))
-        plt.plot(supplies, buy_prices, 'g-', label='Buy Price')
-        plt.plot(supplies, sell_prices, 'r-', label='Sell Price')
-        plt.title(f'Podium Protocol Bonding Curve\n{title}')
-        plt.xlabel('Supply')
-        plt.ylabel('Price (APT)')
+        ax.clear()
+        ax.plot(supplies, buy_prices, 'g-', label='Buy Price')
+        ax.plot(supplies, sell_prices, 'r-', label='Sell Price')
+        ax.set_title(f'Podium Protocol Bonding Curve\n{title}')
+        ax.set_xlabel('Supply')
+        ax.set_ylabel('Price (APT)')
         
         # Use scientific notation for y-axis on larger ranges
         if end > 100:
-            plt.yscale('log')
-            plt.grid(True, which="both", ls="-", alpha=0.2)
+            ax.set_yscale('log')
+            ax.grid(True, which="both", ls="-", alpha=0.2)
         else:
-            plt.grid(True)
+            ax.grid(True)
             
-        plt.legend()
+        ax.legend()
         
         # Save with range in filename
         filename = f'bonding_curve_{end}.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(filename, dpi=150)
 
-def print_price_progression(max_supply=10):
+def print_price_progression(max_supply=10, weights=DEFAULT_WEIGHTS):
     """
     Print detailed price progression up to max_supply
     """
     print("\n=== Price Progression ===")
-    last_price = 0
+    prices = sweep_prices(np.arange(max_supply + 1), False, weights)
     
-    for supply in range(max_supply + 1):
-        price = calculate_price(supply, 1, False)
+    # Convert to APT once for the whole progression rather than per line
+    prices_in_apt = prices / OCTA
+    price_increases = np.diff(prices, prepend=0)
+    increases_in_apt = price_increases / OCTA
+    
+    for supply, price in enumerate(prices):
         print(f"\nSupply: {supply}")
-        print(f"Buy Price: {price/OCTA:.2f} APT ({price} OCTA)")
+        print(f"Buy Price: {prices_in_apt[supply]:.2f} APT ({price} OCTA)")
         
         if supply > 0:
-            price_increase = price - last_price
-            increase_percentage = (price_increase * 10000) // last_price if last_price > 0 else 0
-            print(f"Price increase: {price_increase/OCTA:.2f} APT")
+            last_price = prices[supply - 1]
+            increase_percentage = (price_increases[supply] * 10000) // last_price if last_price > 0 else 0
+            print(f"Price increase: {increases_in_apt[supply]:.2f} APT")
             print(f"Increase percentage: {increase_percentage/100:.2f}%")
-        
-        last_price = price
 
-def print_price_analysis(supply, amount_in_apt):
+def print_price_analysis(supply, amount_in_apt, weights=DEFAULT_WEIGHTS):
     """
     Calculates and returns a breakdown of prices and fees for a purchase
     
@@ -388,65 +753,89 @@ def print_price_analysis(supply, amount_in_apt):
     Returns:
         Dictionary containing base_price, protocol_fee, subject_fee, and total_cost (all in APT)
     """
-    # Convert supply and amount to OCTA units
-    supply_in_octa = supply * OCTA
-    amount_in_octa = amount_in_apt * OCTA
+    fees = print_price_analysis_batch([supply], [amount_in_apt], weights)
+    return {key: float(values[0]) for key, values in fees.items()}
+
+def print_price_analysis_batch(supplies, amounts_in_apt, weights=DEFAULT_WEIGHTS):
+    """
+    Calculates price and fee breakdowns for several purchases at once
     
-    # Get price in OCTA units
-    price_in_octa = calculate_price(supply_in_octa, amount_in_octa, False)
+    Args:
+        supplies: Current supplies in APT
+        amounts_in_apt: Amounts to purchase in APT
     
-    # Convert all values from OCTA to APT for display
-    price_in_apt = price_in_octa / OCTA
-    protocol_fee = (price_in_octa * 4) // 100 / OCTA  # 4%
-    subject_fee = (price_in_octa * 8) // 100 / OCTA   # 8%
-    total_cost = price_in_apt + protocol_fee + subject_fee
+    Returns:
+        Dictionary of arrays containing base_price, protocol_fee, subject_fee, and total_cost (all in APT)
+    """
+    # Get prices in OCTA units. Amounts scaled by OCTA are far too large to
+    # loop over pass by pass, so use the closed form, kept in Python ints
+    # (object arrays) since the totals exceed int64
+    prices_in_octa = np.array([
+        calculate_price_closed_form(int(supply) * OCTA, int(amount) * OCTA, False, weights)
+        for supply, amount in zip(supplies, amounts_in_apt)
+    ], dtype=object)
+    
+    # Fees stay in OCTA until the single conversion to APT for display
+    protocol_fees = (prices_in_octa * 4) // 100  # 4%
+    subject_fees = (prices_in_octa * 8) // 100   # 8%
     
     fees = {
-        'base_price': price_in_apt,
-        'protocol_fee': protocol_fee,
-        'subject_fee': subject_fee,
-        'total_cost': total_cost
+        'base_price': (prices_in_octa / OCTA).astype(np.float64),
+        'protocol_fee': (protocol_fees / OCTA).astype(np.float64),
+        'subject_fee': (subject_fees / OCTA).astype(np.float64),
+        'total_cost': ((prices_in_octa + protocol_fees + subject_fees) / OCTA).astype(np.float64)
     }
     return fees
 
-def analyze_key_price_points():
+def _format_key_price_points(key_points, weights):
+    """Build the key price points table as one string"""
+    # Convert to APT and percentage increases once for all key points
+    prices = get_price_table(max(key_points), False, weights)[key_points]
+    last_prices = np.concatenate(([INITIAL_PRICE], prices[:-1]))
+    prices_in_apt = prices / OCTA
+    increases = (prices - last_prices) / last_prices * 100
+    
+    lines = [
+        "\n=== Key Price Points Analysis ===",
+        "Supply | Buy Price (APT) | % Increase",
+        "-" * 45,
+    ]
+    for supply, price_in_apt, increase in zip(key_points, prices_in_apt, increases):
+        lines.append(f"{supply:6d} | {price_in_apt:13.2f} | {increase:9.1f}%")
+    return "\n".join(lines)
+
+def analyze_key_price_points(key_points=None, weights=DEFAULT_WEIGHTS, file=None):
     """
     Analyze prices at key supply points to validate curve shape
+    Writes to file, or stdout when file is None
     """
-    key_points = [1, 5, 10, 25, 50, 75, 100, 150, 200, 500]
-    
-    print("\n=== Key Price Points Analysis ===")
-    print("Supply | Buy Price (APT) | % Increase")
-    print("-" * 45)
-    
-    last_price = INITIAL_PRICE
-    for supply in key_points:
-        price = calculate_price(supply, 1, False)
-        price_in_apt = price / OCTA
-        increase = ((price - last_price) / last_price * 100) if last_price > 0 else 0
-        
-        print(f"{supply:6d} | {price_in_apt:13.2f} | {increase:9.1f}%")
-        last_price = price
+    if key_points is None:
+        key_points = [1, 5, 10, 25, 50, 75, 100, 150, 200, 500]
+    print(_format_key_price_points(key_points, weights), file=file)
+
+def _format_early_accessibility(weights):
+    """Build the early accessibility table as one string"""
+    lines = [
+        "\n=== Early Accessibility Check (First 15 Passes) ===",
+        "Pass # | Price (APT) | Within Target",
+        "-" * 45,
+    ]
+    prices = get_price_table(15, False, weights)[1:16] / OCTA
+    for i, price in enumerate(prices, start=1):
+        within_target = 1 <= price <= 10
+        lines.append(f"{i:6d} | {price:10.2f} | {'✓' if within_target else '✗'}")
+    return "\n".join(lines)
 
-def validate_early_accessibility():
+def validate_early_accessibility(weights=DEFAULT_WEIGHTS, file=None):
     """
     Validate if early prices (first 15 passes) stay within target range
     Target: 1-10 APT for first 15 passes
+    Writes to file, or stdout when file is None
     """
-    print("\n=== Early Accessibility Check (First 15 Passes) ===")
-    print("Pass # | Price (APT) | Within Target")
-    print("-" * 45)
-    
-    for i in range(1, 16):
-        price = calculate_price(i, 1, False) / OCTA
-        within_target = 1 <= price <= 10
-        print(f"{i:6d} | {price:10.2f} | {'✓' if within_target else '✗'}")
+    print(_format_early_accessibility(weights), file=file)
 
-def analyze_price_bands():
-    """
-    Analyze price progression across different supply bands
-    """
-    print("\n=== Price Band Analysis ===")
+def _format_price_bands(weights):
+    """Build the price band summary as one string"""
     bands = [
         (1, 15, "Entry Band (1-15)"),
         (16, 50, "Growth Band (16-50)"),
@@ -454,114 +843,85 @@ def analyze_price_bands():
         (101, 500, "Exclusivity Band (101+)")
     ]
     
+    lines = ["\n=== Price Band Analysis ==="]
     for start, end, label in bands:
-        prices = [calculate_price(i, 1, False) / OCTA for i in range(start, end + 1)]
-        avg_price = sum(prices) / len(prices)
-        min_price = min(prices)
-        max_price = max(prices)
+        prices = get_price_table(end, False, weights)[start:end + 1] / OCTA
+        avg_price = prices.mean()
+        min_price, max_price = prices.min(), prices.max()
         avg_increase = (max_price - min_price) / min_price * 100
         
-        print(f"\n{label}:")
-        print(f"Average Price: {avg_price:.2f} APT")
-        print(f"Price Range: {min_price:.2f} - {max_price:.2f} APT")
-        print(f"Total Price Increase: {avg_increase:.1f}%")
+        lines.append(f"\n{label}:")
+        lines.append(f"Average Price: {avg_price:.2f} APT")
+        lines.append(f"Price Range: {min_price:.2f} - {max_price:.2f} APT")
+        lines.append(f"Total Price Increase: {avg_increase:.1f}%")
+    return "\n".join(lines)
+
+def analyze_price_bands(weights=DEFAULT_WEIGHTS, file=None):
+    """
+    Analyze price progression across different supply bands
+    Writes to file, or stdout when file is None
+    """
+    print(_format_price_bands(weights), file=file)
 
-def save_results_to_file(output):
+def save_results_to_file(output, weights=DEFAULT_WEIGHTS, file=None):
     """
     Save analysis results to a file with timestamp and weight configuration
+
+    The record is written in one call, to file when an open handle is given
+    and appended to RESULTS_FILENAME otherwise.
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"BondingCurveTestingResults.txt"
-    
-    with open(filename, "a") as f:
-        f.write("\n" + "="*80 + "\n")
-        f.write(f"Test Run: {timestamp}\n")
-        f.write(f"Weight Configuration:\n")
-        f.write(f"WEIGHT_A: {DEFAULT_WEIGHT_A/100:.2f}% ({DEFAULT_WEIGHT_A} bps)\n")
-        f.write(f"WEIGHT_B: {DEFAULT_WEIGHT_B/100:.2f}% ({DEFAULT_WEIGHT_B} bps)\n")
-        f.write(f"WEIGHT_C: {DEFAULT_WEIGHT_C}\n")
-        f.write(f"INITIAL_PRICE: {INITIAL_PRICE/OCTA:.2f} APT\n\n")
-        f.write(output)
-        f.write("\n" + "="*80 + "\n")
+    record = "".join([
+        "\n" + "="*80 + "\n",
+        f"Test Run: {timestamp}\n",
+        f"Weight Configuration:\n",
+        f"WEIGHT_A: {weights.a/100:.2f}% ({weights.a} bps)\n",
+        f"WEIGHT_B: {weights.b/100:.2f}% ({weights.b} bps)\n",
+        f"WEIGHT_C: {weights.c}\n",
+        f"INITIAL_PRICE: {INITIAL_PRICE/OCTA:.2f} APT\n\n",
+        output,
+        "\n" + "="*80 + "\n",
+    ])
+    
+    if file is not None:
+        file.write(record)
+        return
+    with open(RESULTS_FILENAME, "a") as f:
+        f.write(record)
 
-def capture_analysis():
+def capture_analysis(weights=DEFAULT_WEIGHTS):
     """
     Capture all analysis output for saving to file
+    Assembles the report strings directly, without going through print
     """
-    import io
-    from contextlib import redirect_stdout
-    
-    output = io.StringIO()
-    with redirect_stdout(output):
-        print("\n=== Key Price Points Analysis ===")
-        print("Supply | Buy Price (APT) | % Increase")
-        print("-" * 45)
-        
-        last_price = INITIAL_PRICE
-        key_points = [1, 5, 10, 15, 25, 50, 75, 100, 150, 200, 500]
-        for supply in key_points:
-            price = calculate_price(supply, 1, False)
-            price_in_apt = price / OCTA
-            increase = ((price - last_price) / last_price * 100) if last_price > 0 else 0
-            print(f"{supply:6d} | {price_in_apt:13.2f} | {increase:9.1f}%")
-            last_price = price
-
-        print("\n=== Early Accessibility Check (First 15 Passes) ===")
-        print("Pass # | Price (APT) | Within Target")
-        print("-" * 45)
-        for i in range(1, 16):
-            price = calculate_price(i, 1, False) / OCTA
-            within_target = 1 <= price <= 10
-            print(f"{i:6d} | {price:10.2f} | {'✓' if within_target else '✗'}")
-
-        print("\n=== Price Band Analysis ===")
-        bands = [
-            (1, 15, "Entry Band (1-15)"),
-            (16, 50, "Growth Band (16-50)"),
-            (51, 100, "Acceleration Band (51-100)"),
-            (101, 500, "Exclusivity Band (101+)")
-        ]
-        
-        for start, end, label in bands:
-            prices = [calculate_price(i, 1, False) / OCTA for i in range(start, end + 1)]
-            avg_price = sum(prices) / len(prices)
-            min_price = min(prices)
-            max_price = max(prices)
-            avg_increase = (max_price - min_price) / min_price * 100
-            
-            print(f"\n{label}:")
-            print(f"Average Price: {avg_price:.2f} APT")
-            print(f"Price Range: {min_price:.2f} - {max_price:.2f} APT")
-            print(f"Total Price Increase: {avg_increase:.1f}%")
-    
-    return output.getvalue()
+    sections = [
+        _format_key_price_points([1, 5, 10, 15, 25, 50, 75, 100, 150, 200, 500], weights),
+        _format_early_accessibility(weights),
+        _format_price_bands(weights),
+    ]
+    return "\n".join(sections) + "\n"
 
 def main():
-    # Run optimization
-    best_weights = optimize_weights()
-    
-    # Set best weights for final analysis
-    global DEFAULT_WEIGHT_A, DEFAULT_WEIGHT_B, DEFAULT_WEIGHT_C
-    DEFAULT_WEIGHT_A = int(best_weights[0])
-    DEFAULT_WEIGHT_B = int(best_weights[1])
-    DEFAULT_WEIGHT_C = best_weights[2]
-    
-    # Print final analysis
-    print("\nFinal Analysis with Best Weights:")
-    print(f"INITIAL_PRICE: {INITIAL_PRICE/OCTA:.2f} APT")
-    print(f"DEFAULT_WEIGHT_A: {DEFAULT_WEIGHT_A/100:.2f}%")
-    print(f"DEFAULT_WEIGHT_B: {DEFAULT_WEIGHT_B/100:.2f}%")
-    print(f"DEFAULT_WEIGHT_C: {DEFAULT_WEIGHT_C}")
-    
-    # Run and save final analysis
-    results = capture_analysis()
-    save_results_to_file(results)
-    print(results)
-    
-    # Create plots
-    plot_bonding_curves()
+    # Keep the results log open for the whole run
+    with open(RESULTS_FILENAME, "a") as results_file:
+        # Run optimization
+        best_weights, results = optimize_weights(results_file)
+    
+        # Use best weights for final analysis
+        weights = Weights(int(best_weights[0]), int(best_weights[1]), int(best_weights[2]))
+    
+        # Print final analysis
+        print("\nFinal Analysis with Best Weights:")
+        print(f"INITIAL_PRICE: {INITIAL_PRICE/OCTA:.2f} APT")
+        print(f"WEIGHT_A: {weights.a/100:.2f}%")
+        print(f"WEIGHT_B: {weights.b/100:.2f}%")
+        print(f"WEIGHT_C: {weights.c}")
+    
+        # The final analysis was already saved, with its score, by optimize_weights
+        print(results)
+    
+        # Create plots
+        plot_bonding_curves(weights)
 
 if __name__ == "__main__":
     main()
-
-
@@ -6,23 +6,22 @@ def debug_bytes(label, b):
 
 def create_token_seed(collection_name: bytes, token_name: bytes) -> bytes:
     """Mimics token::create_token_seed"""
-    seed = collection_name + b"::" + token_name
-    debug_bytes("Token seed", seed)
-    return seed
+    return collection_name + b"::" + token_name
 
 def create_object_address(creator: bytes, seed: bytes) -> str:
     """Mimics object::create_object_address"""
-    final_bytes = creator + seed
-    debug_bytes("Final bytes for object", final_bytes)
-    addr = keccak_256(final_bytes).hexdigest()
-    return f"0x{addr}"
+    # Hash the parts in place rather than concatenating them first
+    hasher = keccak_256()
+    hasher.update(creator)
+    hasher.update(seed)
+    return f"0x{hasher.hexdigest()}"
 
 def create_collection_address(creator: bytes, collection_name: bytes) -> str:
     """Mimics collection::create_collection_address"""
-    final_bytes = creator + collection_name
-    debug_bytes("Final bytes for collection", final_bytes)
-    addr = keccak_256(final_bytes).hexdigest()
-    return f"0x{addr}"
+    hasher = keccak_256()
+    hasher.update(creator)
+    hasher.update(collection_name)
+    return f"0x{hasher.hexdigest()}"
 
 def main():
     # Input parameters from debug output
@@ -33,15 +32,18 @@ def main():
     print("\n=== Token Address Calculation ===")
     # Calculate token address
     seed = create_token_seed(collection_name, token_name)
+    debug_bytes("Token seed", seed)
+    debug_bytes("Final bytes for object", creator + seed)
     token_addr = create_object_address(creator, seed)
     print(f"Calculated token address: {token_addr}")
     print(f"Debug output token addr: @0x8c26c6afa7b498be26b97d639837aff1be8dd88ef78b61f9bc914408ab6f346c")
 
     print("\n=== Collection Address Calculation ===")
     # Calculate collection address
+    debug_bytes("Final bytes for collection", creator + collection_name)
     collection_addr = create_collection_address(creator, collection_name)
     print(f"Calculated collection address: {collection_addr}")
     print(f"Debug output collection addr: @0x6b173ee689954d7217401e69d9933306f6f29ad05bf1a3f01ca6d25fd29dbf19")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
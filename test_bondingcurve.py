@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from bondingcurve import (
+    DEFAULT_WEIGHTS,
+    INITIAL_PRICE,
+    Weights,
+    _last_floor_supply,
+    _max_safe_supply,
+    _price,
+    _single_pass_price,
+    calculate_price,
+    calculate_price_closed_form,
+    calculate_prices_vec,
+    calculate_single_pass_price,
+)
+
+WEIGHTS = [DEFAULT_WEIGHTS, Weights(100, 100, 1), Weights(20000, 20000, 100)]
+
+def loop_price(supply, amount, is_sell, weights):
+    """Reference pass by pass price, as calculate_price was first written"""
+    total_price = 0
+    for i in range(amount):
+        current_supply = max(supply - i - 1, 0) if is_sell else supply + i
+        total_price += _single_pass_price(current_supply, weights.a, weights.b, weights.c)
+    return total_price
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+@pytest.mark.parametrize("is_sell", [False, True])
+def test_price_matches_pass_by_pass_loop(weights, is_sell):
+    for supply in [0, 1, 2, 3, 10, 57, 300]:
+        for amount in [0, 1, 2, 5, 17, 60]:
+            expected = loop_price(supply, amount, is_sell, weights)
+            assert _price(supply, amount, is_sell, weights.a, weights.b, weights.c) == expected
+            assert calculate_price(supply, amount, is_sell, weights) == expected
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+@pytest.mark.parametrize("is_sell", [False, True])
+def test_closed_form_exact_on_floor(weights, is_sell):
+    boundary = _last_floor_supply(weights)
+    for supply in range(boundary + 2):
+        for amount in range(boundary + 3):
+            top_supply = max(supply - 1, 0) if is_sell else supply + amount - 1
+            if top_supply > boundary:
+                continue
+            assert calculate_price_closed_form(supply, amount, is_sell, weights) == \
+                calculate_price(supply, amount, is_sell, weights)
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+@pytest.mark.parametrize("is_sell", [False, True])
+def test_closed_form_never_below_price(weights, is_sell):
+    for supply in [0, 1, 5, 40, 250]:
+        for amount in [1, 2, 7, 39, 120]:
+            assert calculate_price_closed_form(supply, amount, is_sell, weights) >= \
+                calculate_price(supply, amount, is_sell, weights)
+
+def test_floor_prices_at_initial_price():
+    weights = Weights(100, 100, 1)
+    boundary = _last_floor_supply(weights)
+    assert calculate_single_pass_price(boundary, weights) == INITIAL_PRICE
+    assert calculate_single_pass_price(boundary + 1, weights) > INITIAL_PRICE
+
+def test_numpy_ints_past_overflow_budget():
+    supply = _max_safe_supply(DEFAULT_WEIGHTS) + 10
+    expected = calculate_price(supply, 1, False)
+    assert expected > 2**63 - 1
+    assert calculate_single_pass_price(supply) == expected
+    for integer in (np.int64, np.int32):
+        assert calculate_price(integer(supply), integer(1), False) == expected
+        assert calculate_single_pass_price(integer(supply)) == expected
+
+@pytest.mark.parametrize("is_sell", [False, True])
+def test_overflow_fallback_matches_loop_across_budget(is_sell):
+    weights = Weights(20000, 20000, 100)
+    top = _max_safe_supply(weights)
+    supply = top - 2 if not is_sell else top + 3
+    # The fallback walks in Python ints, so sum exact single pass prices
+    expected = sum(
+        calculate_single_pass_price(max(supply - i - 1, 0) if is_sell else supply + i, weights)
+        for i in range(6)
+    )
+    assert calculate_price(supply, 6, is_sell, weights) == expected
+    assert calculate_price(supply - 3, 2, is_sell, weights) == \
+        loop_price(supply - 3, 2, is_sell, weights)
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+@pytest.mark.parametrize("is_sell", [False, True])
+def test_prices_vec_matches_price(weights, is_sell):
+    top = _max_safe_supply(weights)
+    for supplies in [np.arange(0, 400, 7, dtype=np.int32), np.array([0, 1, top - 3, top + 5])]:
+        for amount in [1, 3, 12]:
+            prices = calculate_prices_vec(supplies, amount, is_sell, weights)
+            assert prices.tolist() == [
+                calculate_price(int(supply), amount, is_sell, weights) for supply in supplies
+            ]